@@ -1,7 +1,8 @@
 """This module defines methods for translating activities from data pipelines."""
 
 from __future__ import annotations
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 
 from wkmigrate.activity_translators.parsers import parse_dependencies, parse_policy
 from wkmigrate.linked_service_translators.databricks_linked_service_translator import (
@@ -17,14 +18,16 @@ from wkmigrate.models.ir.activities import Activity, DatabricksNotebookActivity
 from wkmigrate.not_translatable import not_translatable_context
 
 TypeTranslator = Callable[[dict, dict], Activity | tuple[Activity, list[Activity]]]
-_type_translators: dict[str, TypeTranslator] = {
-    "DatabricksNotebook": translate_notebook_activity,
-    "DatabricksSparkJar": translate_spark_jar_activity,
-    "DatabricksSparkPython": translate_spark_python_activity,
-    "IfCondition": translate_if_condition_activity,
-    "ForEach": translate_for_each_activity,
-    "Copy": translate_copy_activity,
-}
+_type_translators: Mapping[str, TypeTranslator] = MappingProxyType(
+    {
+        "DatabricksNotebook": translate_notebook_activity,
+        "DatabricksSparkJar": translate_spark_jar_activity,
+        "DatabricksSparkPython": translate_spark_python_activity,
+        "IfCondition": translate_if_condition_activity,
+        "ForEach": translate_for_each_activity,
+        "Copy": translate_copy_activity,
+    }
+)
 
 
 def translate_activities(activities: list[dict] | None) -> list[Activity] | None:
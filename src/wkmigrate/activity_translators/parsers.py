@@ -13,6 +13,14 @@ from wkmigrate.models.ir.datasets import Dataset, DatasetProperties
 from wkmigrate.not_translatable import NotTranslatableWarning
 
 
+# TODO: Move all dynamic function patterns to a common enum list
+_ARRAY_PATTERN = re.compile(r"@array\('(.+)'\)")
+_CREATE_ARRAY_PATTERN = re.compile(r"@createArray\((.+)\)")
+_CONDITION_OPERATION_PATTERNS = tuple(
+    (operation.name, re.compile(operation.value)) for operation in ConditionOperationPattern
+)
+
+
 def parse_dataset(datasets: list[dict]) -> Dataset:
     """
     Parses a dataset definition from a Data Factory pipeline activity into IR.
@@ -127,15 +135,12 @@ def parse_for_each_items(items: dict | None) -> str | None:
     value = items.get("value")
     if value is None:
         return None
-    # TODO: Move all dynamic function patterns to a common enum list
-    array_pattern = r"@array\('(.+)'\)"
-    match = re.match(string=value, pattern=array_pattern)
+    match = _ARRAY_PATTERN.match(value)
     if match:
         matched_item = match.group(1)
         return _parse_array_string(matched_item)
 
-    create_array_pattern = r"@createArray\((.+)\)"
-    match = re.match(string=value, pattern=create_array_pattern)
+    match = _CREATE_ARRAY_PATTERN.match(value)
     if match:
         matched_item = match.group(1)
         list_items = ast.literal_eval(matched_item)
@@ -276,11 +281,11 @@ def parse_condition_expression(condition: dict) -> dict:
     condition_value = str(condition.get("value"))
     if not condition_value:
         raise ValueError("Missing condition value")
-    for operation in ConditionOperationPattern:
-        match = re.match(string=condition_value, pattern=operation.value)
+    for operation_name, operation_pattern in _CONDITION_OPERATION_PATTERNS:
+        match = operation_pattern.match(condition_value)
         if match is not None:
             return {
-                "op": operation.name,
+                "op": operation_name,
                 "left": match.group(1).replace('"', "").replace("'", ""),
                 "right": match.group(2).replace('"', "").replace("'", ""),
             }
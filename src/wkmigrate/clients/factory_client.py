@@ -1,9 +1,12 @@
 """Defines the ``FactoryClient`` class."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from azure.identity import ClientSecretCredential
-from azure.mgmt.datafactory import DataFactoryManagementClient
+if TYPE_CHECKING:
+    from azure.mgmt.datafactory import DataFactoryManagementClient
 
 
 @dataclass
@@ -39,6 +42,10 @@ class FactoryClient:
             raise ValueError("A client_id must be provided when creating a FactoryDefinitionStore")
         if self.client_secret is None:
             raise ValueError("A client_secret must be provided when creating a FactoryDefinitionStore")
+        # Imported here so that loading this module does not pull in the Azure SDK
+        from azure.identity import ClientSecretCredential  # pylint: disable=import-outside-toplevel
+        from azure.mgmt.datafactory import DataFactoryManagementClient  # pylint: disable=import-outside-toplevel
+
         credential = ClientSecretCredential(
             tenant_id=self.tenant_id,
             client_id=self.client_id,
@@ -1,14 +1,18 @@
 """This module defines methods for mapping data types from target systems to Spark."""
 
-sql_server_type_mapping = {
-    "Boolean": "boolean",
-    "Int16": "short",
-    "Int32": "int",
-    "Int64": "long",
-    "Single": "float",
-    "Double": "double",
-    "Decimal": "decimal(38, 38)",
-}
+from types import MappingProxyType
+
+sql_server_type_mapping = MappingProxyType(
+    {
+        "Boolean": "boolean",
+        "Int16": "short",
+        "Int32": "int",
+        "Int64": "long",
+        "Single": "float",
+        "Double": "double",
+        "Decimal": "decimal(38, 38)",
+    }
+)
 
 
 def parse_spark_data_type(sink_type: str, sink_system: str) -> str:
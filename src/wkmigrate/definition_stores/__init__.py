@@ -1,9 +1,43 @@
 """Factory functions for definition store implementations."""
 
-from wkmigrate.definition_stores.factory_definition_store import FactoryDefinitionStore
-from wkmigrate.definition_stores.workspace_definition_store import WorkspaceDefinitionStore
+from collections.abc import Iterator, Mapping
+from importlib import import_module
+from types import MappingProxyType
 
-types = {
-    "factory_definition_store": FactoryDefinitionStore,
-    "workspace_definition_store": WorkspaceDefinitionStore,
-}
+_DEFINITION_STORE_PATHS = MappingProxyType(
+    {
+        "factory_definition_store": (
+            "wkmigrate.definition_stores.factory_definition_store",
+            "FactoryDefinitionStore",
+        ),
+        "workspace_definition_store": (
+            "wkmigrate.definition_stores.workspace_definition_store",
+            "WorkspaceDefinitionStore",
+        ),
+    }
+)
+
+
+class _DefinitionStoreTypes(Mapping[str, type]):
+    """Maps definition store types to their classes, importing each class and its SDK dependencies on first use."""
+
+    def __getitem__(self, definition_store_type: str) -> type:
+        module_name, class_name = _DEFINITION_STORE_PATHS[definition_store_type]
+        return getattr(import_module(module_name), class_name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_DEFINITION_STORE_PATHS)
+
+    def __len__(self) -> int:
+        return len(_DEFINITION_STORE_PATHS)
+
+
+types = _DefinitionStoreTypes()
+
+
+def __getattr__(name: str) -> type:
+    """Lazily imports definition store classes so their SDK dependencies load only when used."""
+    for definition_store_type, (_, class_name) in _DEFINITION_STORE_PATHS.items():
+        if class_name == name:
+            return types[definition_store_type]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import base64
+import hashlib
+import io
 import json
 import os
 import warnings
 from collections.abc import Iterable
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.jobs import CronSchedule, Job, Task
@@ -23,6 +24,9 @@ from wkmigrate.models.workflows.artifacts import PreparedWorkflow
 from wkmigrate.workflows.preparer import prepare_workflow
 
 
+_MAX_CONCURRENT_REQUESTS = 8
+
+
 @dataclass
 class WorkspaceDefinitionStore(DefinitionStore):
     """
@@ -53,6 +57,10 @@ class WorkspaceDefinitionStore(DefinitionStore):
     client_secret: str | None = None
     files_to_delta_sinks: bool | None = None
     workspace_client: WorkspaceClient | None = field(init=False, default=None)
+    _secret_scopes: set[str] | None = field(init=False, default=None, repr=False)
+    _existing_notebook_paths: set[str] = field(init=False, default_factory=set, repr=False)
+    _uploaded_notebooks: dict[str, tuple[str, str]] = field(init=False, default_factory=dict, repr=False)
+    _created_folders: set[str] = field(init=False, default_factory=set, repr=False)
     _valid_authentication_types = ["pat", "basic", "azure-client-secret"]
 
     def __post_init__(self) -> None:
@@ -99,6 +107,11 @@ class WorkspaceDefinitionStore(DefinitionStore):
         """
         prepared = self._prepare_workflow(Pipeline(**pipeline_definition))
         client = self._get_workspace_client()
+        # Workspace state may change between calls; only reuse lookups and uploads within one workflow
+        self._secret_scopes = None
+        self._existing_notebook_paths.clear()
+        self._uploaded_notebooks.clear()
+        self._created_folders.clear()
         self._upload_notebooks(client, prepared.notebooks)
         self._materialize_secrets(client, prepared.secrets)
         self._materialize_pipelines(client, prepared.pipelines)
@@ -156,22 +169,49 @@ class WorkspaceDefinitionStore(DefinitionStore):
 
     def _upload_notebooks(self, client: WorkspaceClient, notebooks: Iterable[NotebookArtifact]) -> None:
         """
-        Uploads generated notebooks to the workspace.
+        Uploads generated notebooks to the workspace concurrently. Within a workflow, parent folders are created
+        once and notebooks whose language and content match the last upload to the same path are skipped.
 
         Args:
             client: Authenticated workspace client.
             notebooks: Notebook artifacts to upload.
         """
-        for notebook in notebooks:
-            folder = "/".join(notebook.file_path.split("/")[:-1])
+        notebooks_by_path = {notebook.file_path: notebook for notebook in notebooks}
+        upload_keys = {
+            path: (notebook.language, hashlib.sha256(notebook.content.encode()).hexdigest())
+            for path, notebook in notebooks_by_path.items()
+        }
+        pending = [
+            notebook
+            for path, notebook in notebooks_by_path.items()
+            if self._uploaded_notebooks.get(path) != upload_keys[path]
+        ]
+        folders = {notebook.file_path.rsplit("/", 1)[0] for notebook in pending} - self._created_folders
+        for folder in sorted(folders):
             client.workspace.mkdirs(folder)
-            client.workspace.import_(
-                content=base64.b64encode(notebook.content.encode()).decode(),
-                format=ImportFormat.SOURCE,
-                language=Language.PYTHON if notebook.language == "python" else Language.SCALA,
-                overwrite=True,
-                path=notebook.file_path,
-            )
+            self._created_folders.add(folder)
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+            futures = [executor.submit(self._upload_notebook, client, notebook) for notebook in pending]
+        for notebook, future in zip(pending, futures):
+            future.result()
+            self._uploaded_notebooks[notebook.file_path] = upload_keys[notebook.file_path]
+
+    @staticmethod
+    def _upload_notebook(client: WorkspaceClient, notebook: NotebookArtifact) -> None:
+        """
+        Uploads a single generated notebook to the workspace. The parent folder must already exist.
+
+        Args:
+            client: Authenticated workspace client.
+            notebook: Notebook artifact to upload.
+        """
+        client.workspace.upload(
+            notebook.file_path,
+            io.BytesIO(notebook.content.encode()),
+            format=ImportFormat.SOURCE,
+            language=Language.PYTHON if notebook.language == "python" else Language.SCALA,
+            overwrite=True,
+        )
 
     def _materialize_pipelines(
         self,
@@ -220,12 +260,36 @@ class WorkspaceDefinitionStore(DefinitionStore):
         """
         if not secrets_to_create:
             return
-        scopes = [scope.name for scope in client.secrets.list_scopes()]
+        scopes = self._list_secret_scopes(client)
         if "wkmigrate_credentials_scope" not in scopes:
             client.secrets.create_scope(scope="wkmigrate_credentials_scope")
-        for secret in secrets_to_create:
-            value = secret.provided_value or "PLACEHOLDER_SECRET_VALUE"
-            client.secrets.put_secret(scope=secret.scope, key=secret.key, string_value=value)
+            scopes.add("wkmigrate_credentials_scope")
+        # Activities that share a linked service emit the same secret; write each scope/key pair once
+        secret_values = {
+            (secret.scope, secret.key): secret.provided_value or "PLACEHOLDER_SECRET_VALUE"
+            for secret in secrets_to_create
+        }
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+            futures = [
+                executor.submit(client.secrets.put_secret, scope=scope, key=key, string_value=value)
+                for (scope, key), value in secret_values.items()
+            ]
+        for future in futures:
+            future.result()
+
+    def _list_secret_scopes(self, client: WorkspaceClient) -> set[str]:
+        """
+        Returns the secret scope names in the workspace, listing them once per ``to_pipeline`` call.
+
+        Args:
+            client: Authenticated workspace client.
+
+        Returns:
+            Secret scope names as a ``set[str]``.
+        """
+        if self._secret_scopes is None:
+            self._secret_scopes = {scope.name for scope in client.secrets.list_scopes() if scope.name is not None}
+        return self._secret_scopes
 
     def _ensure_notebook_dependencies(
         self,
@@ -250,10 +314,10 @@ class WorkspaceDefinitionStore(DefinitionStore):
                 inner_task_list = inner_task if isinstance(inner_task, list) else [inner_task]
                 self._ensure_notebook_dependencies(client, inner_task_list)
 
-    @staticmethod
-    def _ensure_notebook_exists(client: WorkspaceClient, task: dict) -> None:
+    def _ensure_notebook_exists(self, client: WorkspaceClient, task: dict) -> None:
         """
-        Verifies that a notebook referenced by a task exists in the workspace.
+        Verifies that a notebook referenced by a task exists in the workspace. Notebooks that were already
+        found are not checked again.
 
         Args:
             client: Authenticated workspace client.
@@ -270,10 +334,14 @@ class WorkspaceDefinitionStore(DefinitionStore):
         if notebook_path_value is None:
             raise ValueError('No "notebook_path" found in notebook_task')
         notebook_path = f"/Workspace{notebook_path_value}"
+        if notebook_path in self._existing_notebook_paths:
+            return
         try:
             client.workspace.get_status(path=notebook_path)
         except Exception:
             warnings.warn(f"Notebook {notebook_path} not found in target workspace", stacklevel=3)
+            return
+        self._existing_notebook_paths.add(notebook_path)
 
     def _write_local_artifacts(self, prepared: PreparedWorkflow, output_dir: str) -> None:
         """
@@ -506,7 +574,7 @@ class WorkspaceDefinitionStore(DefinitionStore):
         Returns:
             Jobs API payload as a ``dict``.
         """
-        payload = deepcopy(job_settings)
+        payload = dict(job_settings)
         payload.pop("not_translatable", None)
         tasks = payload.get("tasks") or []
         payload["tasks"] = [Task.from_dict(task) for task in tasks]
@@ -2,10 +2,9 @@
 
 from uuid import uuid4
 from wkmigrate.linked_service_translators.parsers import (
-    parse_autoscale_policy,
+    parse_cluster_size,
     parse_init_scripts,
     parse_log_conf,
-    parse_number_of_workers,
 )
 from wkmigrate.models.ir.linked_services import DatabricksClusterLinkedService
 from wkmigrate.utils import append_system_tags
@@ -36,7 +35,6 @@ def translate_cluster_spec(cluster_spec: dict) -> DatabricksClusterLinkedService
         spark_env_vars=properties.get("new_cluster_spark_env_vars"),
         init_scripts=parse_init_scripts(properties.get("new_cluster_init_scripts", [])),
         cluster_log_conf=parse_log_conf(properties.get("new_cluster_log_destination")),
-        autoscale=parse_autoscale_policy(properties.get("new_cluster_num_of_worker")),
-        num_workers=parse_number_of_workers(properties.get("new_cluster_num_of_worker")),
         pat=properties.get("pat"),
+        **parse_cluster_size(properties.get("new_cluster_num_of_worker")),
     )
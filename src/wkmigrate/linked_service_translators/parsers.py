@@ -4,6 +4,16 @@ import re
 from wkmigrate.enums.init_script_type import InitScriptType
 
 
+_ACCOUNT_NAME_PATTERN = re.compile(r"AccountName=([a-zA-Z0-9]+);")
+_PROTOCOL_PATTERN = re.compile(r"DefaultEndpointsProtocol=([a-zA-Z0-9]+);")
+_ENDPOINT_SUFFIX_PATTERN = re.compile(r"EndpointSuffix=([a-zA-Z0-9\.]+);")
+
+_INIT_SCRIPT_TYPE_PREFIXES = (
+    ("dbfs:", InitScriptType.DBFS.value),
+    ("/Volumes", InitScriptType.VOLUMES.value),
+)
+
+
 def parse_log_conf(cluster_log_destination: str | None) -> dict | None:
     """
     Parses a cluster log configuration from a DBFS destination into a dictionary of log settings.
@@ -19,38 +29,26 @@ def parse_log_conf(cluster_log_destination: str | None) -> dict | None:
     return {"dbfs": {"destination": cluster_log_destination}}
 
 
-def parse_number_of_workers(num_workers: str | None) -> int | None:
+def parse_cluster_size(num_workers: str | None) -> dict:
     """
-    Parses a static cluster size from the linked-service payload into an integer.
+    Parses a cluster size (e.g., ``"4"`` or ``"1:4"``) into fixed-size or autoscaling cluster settings.
 
     Args:
-        num_workers: Number of workers, represented as a string.
+        num_workers: Number of workers, or an autoscaling range encoded as ``"min:max"``.
 
     Returns:
-        Parsed worker count as an ``int``, or ``None`` if autoscaling is used.
-    """
-    if num_workers is None or ":" in num_workers:
-        return None
-    return int(num_workers)
-
+        Dictionary with either ``num_workers`` or an ``autoscale`` policy as a ``dict``, or an empty ``dict`` when
+        no cluster size is provided.
 
-def parse_autoscale_policy(autoscale_policy: str | None) -> dict | None:
+    Raises:
+        ValueError: If the cluster size is not an integer or a ``"min:max"`` range of integers.
     """
-    Parses a Databricks autoscaling policy (e.g., ``"1:4"``) into a dictionary of worker counts.
-
-    Args:
-        autoscale_policy: Autoscaling range encoded as ``"min:max"``.
-
-    Returns:
-        Dictionary with ``min_workers`` / ``max_workers`` as a ``dict``.
-    """
-    if autoscale_policy is None or ":" not in autoscale_policy:
-        return None
-    autoscale_num_workers = autoscale_policy.split(":")
-    return {
-        "min_workers": int(autoscale_num_workers[0]),
-        "max_workers": int(autoscale_num_workers[1]),
-    }
+    if num_workers is None:
+        return {}
+    min_workers, separator, max_workers = num_workers.partition(":")
+    if separator:
+        return {"autoscale": {"min_workers": int(min_workers), "max_workers": int(max_workers)}}
+    return {"num_workers": int(min_workers)}
 
 
 def parse_init_scripts(init_scripts: list[str] | None) -> list[dict] | None:
@@ -81,9 +79,9 @@ def parse_storage_account_connection_string(connection_string: str) -> str:
     Returns:
         Blob endpoint URL extracted from the connection string as a ``str``.
     """
-    account_name = _extract_group(connection_string, r"AccountName=([a-zA-Z0-9]+);")
-    protocol = _extract_group(connection_string, r"DefaultEndpointsProtocol=([a-zA-Z0-9]+);")
-    suffix = _extract_group(connection_string, r"EndpointSuffix=([a-zA-Z0-9\.]+);")
+    account_name = _extract_group(connection_string, _ACCOUNT_NAME_PATTERN)
+    protocol = _extract_group(connection_string, _PROTOCOL_PATTERN)
+    suffix = _extract_group(connection_string, _ENDPOINT_SUFFIX_PATTERN)
     return f"{protocol}://{account_name}.blob.{suffix}/"
 
 
@@ -97,23 +95,23 @@ def parse_storage_account_name(connection_string: str) -> str:
     Returns:
         Storage account name as a ``str``.
     """
-    return _extract_group(connection_string, r"AccountName=([a-zA-Z0-9]+);")
+    return _extract_group(connection_string, _ACCOUNT_NAME_PATTERN)
 
 
-def _extract_group(input_string: str, regex: str) -> str:
+def _extract_group(input_string: str, regex: re.Pattern[str]) -> str:
     """
     Extracts a regex group from an input string.
 
     Args:
         input_string: Input string to search.
-        regex: Regex pattern to match.
+        regex: Compiled regex pattern to match.
 
     Returns:
         Extracted group as a ``str``.
     """
-    match = re.search(pattern=regex, string=input_string)
+    match = regex.search(input_string)
     if match is None:
-        raise ValueError(f"No match for regex '{regex}' found in input string '{input_string}'")
+        raise ValueError(f"No match for regex '{regex.pattern}' found in input string '{input_string}'")
     return match.group(1)
 
 
@@ -127,8 +125,7 @@ def _get_init_script_type(init_script_path: str) -> str:
     Returns:
         Init script type as a ``str``.
     """
-    if init_script_path.startswith("dbfs:"):
-        return InitScriptType.DBFS.value
-    if init_script_path.startswith("/Volumes"):
-        return InitScriptType.VOLUMES.value
+    for prefix, init_script_type in _INIT_SCRIPT_TYPE_PREFIXES:
+        if init_script_path.startswith(prefix):
+            return init_script_type
     return InitScriptType.WORKSPACE.value
@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from wkmigrate.models.ir.activities import Activity
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineTask:
     """
     Wrapper associating an ``Activity`` with a workflow task slot.
@@ -19,7 +19,7 @@ class PipelineTask:
     activity: Activity
 
 
-@dataclass
+@dataclass(slots=True)
 class Pipeline:
     """
     Pipeline IR object produced by the translator.
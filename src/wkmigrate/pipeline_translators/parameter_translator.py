@@ -1,10 +1,12 @@
 """This module defines methods for translating Databricks parameter values from data pipelines."""
 
+from types import MappingProxyType
+
 from wkmigrate.pipeline_translators.parsers import parse_parameter_value
 from wkmigrate.utils import translate
 
 
-mapping = {"default": {"key": "default_value", "parser": parse_parameter_value}}
+mapping = MappingProxyType({"default": {"key": "default_value", "parser": parse_parameter_value}})
 
 
 def translate_parameters(parameters: dict | None) -> list[dict] | None:
@@ -1,10 +1,25 @@
 """This module defines methods for parsing trigger objects to the Databricks SDK's object model."""
 
 import warnings
+from types import MappingProxyType
+
 from wkmigrate.enums.interval_type import IntervalType
 from wkmigrate.not_translatable import NotTranslatableWarning
 
 
+_WEEK_DAYS = MappingProxyType(
+    {
+        "Sunday": "1",
+        "Monday": "2",
+        "Tuesday": "3",
+        "Wednesday": "4",
+        "Thursday": "5",
+        "Friday": "6",
+        "Saturday": "7",
+    }
+)
+
+
 def parse_cron_expression(recurrence: dict | None) -> str | None:
     """
     Generates a quartz cron expression from a set of schedule trigger parameters.
@@ -25,40 +40,35 @@ def parse_cron_expression(recurrence: dict | None) -> str | None:
             stacklevel=2,
         )
         num_intervals = 1
-    schedule = recurrence.get("schedule")
-    if interval_type == IntervalType.HOUR:
-        return _get_hourly_cron_expression(num_intervals)
-    if interval_type == IntervalType.DAY:
-        return _get_daily_cron_expression(num_intervals, schedule or {})
-    if interval_type == IntervalType.WEEK:
-        if num_intervals > 1:
-            warnings.warn(
-                NotTranslatableWarning(
-                    "schedule.num_intervals",
-                    'Ignoring "num_intervals" > 1 for weekly triggers; Using weekly interval',
-                ),
-                stacklevel=2,
-            )
-        return _get_weekly_cron_expression(schedule or {})
-    if interval_type == IntervalType.MONTH:
-        if num_intervals > 1:
-            warnings.warn(
-                NotTranslatableWarning(
-                    "schedule.num_intervals",
-                    'Ignoring "num_intervals" > 1 for monthly triggers; Using monthly interval',
-                ),
-                stacklevel=2,
-            )
-        return _get_monthly_cron_expression(schedule or {})
-    return None
-
-
-def _get_hourly_cron_expression(num_intervals: int) -> str:
+    if interval_type == IntervalType.WEEK and num_intervals > 1:
+        warnings.warn(
+            NotTranslatableWarning(
+                "schedule.num_intervals",
+                'Ignoring "num_intervals" > 1 for weekly triggers; Using weekly interval',
+            ),
+            stacklevel=2,
+        )
+    if interval_type == IntervalType.MONTH and num_intervals > 1:
+        warnings.warn(
+            NotTranslatableWarning(
+                "schedule.num_intervals",
+                'Ignoring "num_intervals" > 1 for monthly triggers; Using monthly interval',
+            ),
+            stacklevel=2,
+        )
+    builder = _CRON_EXPRESSION_BUILDERS.get(interval_type)
+    if builder is None:
+        return None
+    return builder(num_intervals, recurrence.get("schedule") or {})
+
+
+def _get_hourly_cron_expression(num_intervals: int, _schedule: dict | None) -> str:
     """
     Builds a cron expression for an hourly schedule.
 
     Args:
         num_intervals: Hour interval between runs.
+        _schedule: Unused; hourly schedules run at the top of the hour.
 
     Returns:
         Cron expression as a ``str``.
@@ -79,16 +89,17 @@ def _get_daily_cron_expression(num_intervals: int, schedule: dict | None) -> str
     """
     if schedule is None:
         return f"0 0 0 */{num_intervals} * ?"
-    minutes = ",".join([str(e) for e in schedule.get("minutes", [0])])
-    hours = ",".join([str(e) for e in schedule.get("hours", [0])])
+    minutes = ",".join(str(e) for e in schedule.get("minutes", [0]))
+    hours = ",".join(str(e) for e in schedule.get("hours", [0]))
     return f"0 {minutes} {hours} */{num_intervals} * ?"
 
 
-def _get_weekly_cron_expression(schedule: dict | None) -> str:
+def _get_weekly_cron_expression(_num_intervals: int, schedule: dict | None) -> str:
     """
     Builds a cron expression for a weekly schedule.
 
     Args:
+        _num_intervals: Unused; weekly schedules always run every week.
         schedule: Dictionary containing minutes, hours, and week days.
 
     Returns:
@@ -96,17 +107,18 @@ def _get_weekly_cron_expression(schedule: dict | None) -> str:
     """
     if schedule is None:
         return "0 0 0 ? * 1"
-    minutes = ",".join([str(e) for e in schedule.get("minutes", [0])])
-    hours = ",".join([str(e) for e in schedule.get("hours", [0])])
-    week_days = ",".join([_get_week_day(e) for e in schedule.get("week_days", ["Sunday"])])
+    minutes = ",".join(str(e) for e in schedule.get("minutes", [0]))
+    hours = ",".join(str(e) for e in schedule.get("hours", [0]))
+    week_days = ",".join(_get_week_day(e) for e in schedule.get("week_days", ["Sunday"]))
     return f"0 {minutes} {hours} ? * {week_days}"
 
 
-def _get_monthly_cron_expression(schedule: dict | None) -> str:
+def _get_monthly_cron_expression(_num_intervals: int, schedule: dict | None) -> str:
     """
     Builds a cron expression for a monthly schedule.
 
     Args:
+        _num_intervals: Unused; monthly schedules always run every month.
         schedule: Dictionary containing minutes, hours, and days.
 
     Returns:
@@ -114,12 +126,22 @@ def _get_monthly_cron_expression(schedule: dict | None) -> str:
     """
     if schedule is None:
         return "0 0 0 0 * ?"
-    minutes = ",".join([str(e) for e in schedule.get("minutes", [0])])
-    hours = ",".join([str(e) for e in schedule.get("hours", [0])])
-    days = ",".join([str(e) for e in schedule.get("days", [0])])
+    minutes = ",".join(str(e) for e in schedule.get("minutes", [0]))
+    hours = ",".join(str(e) for e in schedule.get("hours", [0]))
+    days = ",".join(str(e) for e in schedule.get("days", [0]))
     return f"0 {minutes} {hours} {days} * ?"
 
 
+_CRON_EXPRESSION_BUILDERS = MappingProxyType(
+    {
+        IntervalType.HOUR: _get_hourly_cron_expression,
+        IntervalType.DAY: _get_daily_cron_expression,
+        IntervalType.WEEK: _get_weekly_cron_expression,
+        IntervalType.MONTH: _get_monthly_cron_expression,
+    }
+)
+
+
 def _get_week_day(week_day: str) -> str:
     """
     Converts a named weekday to the quartz cron numeric equivalent.
@@ -133,18 +155,7 @@ def _get_week_day(week_day: str) -> str:
     Raises:
         ValueError: If the weekday string is not recognized.
     """
-    if week_day == "Sunday":
-        return "1"
-    if week_day == "Monday":
-        return "2"
-    if week_day == "Tuesday":
-        return "3"
-    if week_day == "Wednesday":
-        return "4"
-    if week_day == "Thursday":
-        return "5"
-    if week_day == "Friday":
-        return "6"
-    if week_day == "Saturday":
-        return "7"
-    raise ValueError('Invalid value for parameter "week_day"')
+    cron_week_day = _WEEK_DAYS.get(week_day)
+    if cron_week_day is None:
+        raise ValueError('Invalid value for parameter "week_day"')
+    return cron_week_day
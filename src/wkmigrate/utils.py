@@ -1,5 +1,6 @@
 """This module defines shared utilities for translating data pipelines."""
 
+from collections.abc import Mapping
 from typing import Any
 
 
@@ -8,7 +9,7 @@ def identity(item: Any) -> Any:
     return item
 
 
-def translate(items: dict | None, mapping: dict) -> dict | None:
+def translate(items: dict | None, mapping: Mapping) -> dict | None:
     """
     Maps dictionary values using a translation specification.
 
@@ -22,10 +23,8 @@ def translate(items: dict | None, mapping: dict) -> dict | None:
     if items is None:
         return None
     output = {}
-    for key, value in mapping.items():
-        source_key = mapping[key]["key"]
-        parser = mapping[key]["parser"]
-        value = parser(items.get(source_key))
+    for key, spec in mapping.items():
+        value = spec["parser"](items.get(spec["key"]))
         if value is not None:
             output[key] = value
     return output
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import asdict, is_dataclass
+from string import Template
+from types import MappingProxyType
 from typing import Any
 
 import autopep8  # type: ignore
@@ -25,6 +27,107 @@ from wkmigrate.models.workflows.instructions import PipelineInstruction, SecretI
 
 PreparedTaskResult = tuple[list[NotebookArtifact], list[PipelineInstruction], list[SecretInstruction]]
 
+_NOTEBOOK_HEADER = (
+    "# Databricks notebook source",
+    "import pyspark.sql.types as T",
+    "import pyspark.sql.functions as F",
+    "",
+    "# Set the source options:",
+)
+
+_CAST_COLUMN_TEMPLATE = '"cast({source_column} as {sink_type}) as {sink_column}"'.format
+_RENAME_COLUMN_TEMPLATE = '"{source_column} as {sink_column}"'.format
+_COLUMN_SEPARATOR = ", \n\t"
+
+_FILE_WRITE_TEMPLATE = Template(
+    r"""${dataset_name}_df.write.format("${dataset_type}")  \
+                        .options(**${dataset_name}_options)  \
+                        .mode("overwrite")  \
+                        .save("abfss://${container_name}@${storage_account_name}.dfs.core.windows.net/${folder_path}")
+                    """
+)
+
+_WRITE_TEMPLATES = MappingProxyType(
+    {
+        "avro": Template(
+            r"""${dataset_name}_df.write.format("avro")  \
+                        .mode("overwrite")  \
+                        .save("abfss://${container_name}@${storage_account_name}.dfs.core.windows.net/${folder_path}")
+                    """
+        ),
+        "csv": _FILE_WRITE_TEMPLATE,
+        "delta": Template(
+            r"""${dataset_name}_df.write.format("delta")  \
+                        .mode("overwrite")  \
+                        .saveAsTable("hive_metastore.${database_name}.${table_name}")
+                    """
+        ),
+        "json": _FILE_WRITE_TEMPLATE,
+        "orc": _FILE_WRITE_TEMPLATE,
+        "parquet": _FILE_WRITE_TEMPLATE,
+        "sqlserver": Template(
+            r"""${dataset_name}_df.write.format("jdbc")  \
+                        .options(**${dataset_name}_options)  \
+                        .save()
+                    """
+        ),
+    }
+)
+
+_FILE_READ_TEMPLATE = Template(
+    """${dataset_name}_df = ( 
+                        spark.read.format("${dataset_type}")
+                            .options(**${dataset_name}_options)
+                            .load("abfss://${container_name}@${storage_account_name}.dfs.core.windows.net/${folder_path}")
+                        )
+                    """
+)
+
+_READ_TEMPLATES = MappingProxyType(
+    {
+        "avro": Template(
+            """${dataset_name}_df = ( 
+                        spark.read.format("avro")
+                            .load("abfss://${container_name}@${storage_account_name}.dfs.core.windows.net/${folder_path}")
+                    )
+                    """
+        ),
+        "csv": _FILE_READ_TEMPLATE,
+        "delta": Template('${dataset_name}_df = spark.read.table("hive_metastore.${database_name}.${table_name}'),
+        "json": _FILE_READ_TEMPLATE,
+        "orc": _FILE_READ_TEMPLATE,
+        "parquet": _FILE_READ_TEMPLATE,
+        "sqlserver": Template(
+            """${dataset_name}_df = ( 
+                    spark.read.format("sqlserver")
+                        .options(**${dataset_name}_options)
+                        .option("dbtable", "${schema_name}.${table_name}")
+                        .load()
+                    )
+                    """
+        ),
+    }
+)
+
+_STORAGE_ACCOUNT_KEY_TEMPLATE = Template(
+    """spark.conf.set(
+                "fs.azure.account.key.${storage_account_name}.dfs.core.windows.net",
+                    dbutils.secrets.get(
+                        scope="wkmigrate_credentials_scope", 
+                        key="${service_name}_storage_account_key"
+                )
+            )
+            """
+)
+
+_SECRET_OPTION_TEMPLATE = Template(
+    """${dataset_name}_options["${secret}"] = dbutils.secrets.get(
+                scope="wkmigrate_credentials_scope", 
+                key="${service_name}_${secret}"
+            )
+            """
+)
+
 
 def prepare_workflow(pipeline_definition: Pipeline, files_to_delta_sinks: bool | None = None) -> PreparedWorkflow:
     """
@@ -148,21 +251,13 @@ def _prepare_tasks(
     output_pipelines: list[PipelineInstruction] = []
     output_secrets: list[SecretInstruction] = []
     for task in tasks:
-        task_type = task.get("type")
-        if task_type == "Copy":
-            copy_activity_notebooks, copy_activity_pipelines, copy_activity_secrets = _prepare_copy_task(
-                task, default_files_to_delta_sinks
-            )
-            output_notebooks.extend(copy_activity_notebooks)
-            output_pipelines.extend(copy_activity_pipelines)
-            output_secrets.extend(copy_activity_secrets)
-        elif task_type == "ForEach":
-            foreach_activity_notebooks, foreach_activity_pipelines, foreach_activity_secrets = _prepare_for_each_task(
-                task, default_files_to_delta_sinks
-            )
-            output_notebooks.extend(foreach_activity_notebooks)
-            output_pipelines.extend(foreach_activity_pipelines)
-            output_secrets.extend(foreach_activity_secrets)
+        task_preparer = _TASK_PREPARERS.get(task.get("type"))
+        if task_preparer is None:
+            continue
+        task_notebooks, task_pipelines, task_secrets = task_preparer(task, default_files_to_delta_sinks)
+        output_notebooks.extend(task_notebooks)
+        output_pipelines.extend(task_pipelines)
+        output_secrets.extend(task_secrets)
     return output_notebooks, output_pipelines, output_secrets
 
 
@@ -258,6 +353,14 @@ def _prepare_copy_task(
     return notebooks, [pipeline_instruction], secrets_to_collect
 
 
+_TASK_PREPARERS = MappingProxyType(
+    {
+        "Copy": _prepare_copy_task,
+        "ForEach": _prepare_for_each_task,
+    }
+)
+
+
 def _merge_dataset_definition(dataset: Dataset | dict | None, properties: DatasetProperties | dict | None) -> dict:
     """
     Merges dataset metadata with parsed dataset properties.
@@ -372,13 +475,7 @@ def _create_copy_data_notebook(
     Returns:
         Notebook workspace path and the artifact to upload as a ``tuple[str, NotebookArtifact]``.
     """
-    script_lines = [
-        "# Databricks notebook source",
-        "import pyspark.sql.types as T",
-        "import pyspark.sql.functions as F",
-        "",
-        "# Set the source options:",
-    ]
+    script_lines = list(_NOTEBOOK_HEADER)
     script_lines.extend(_get_option_expressions(source_definition))
     if not files_to_delta_sinks:
         script_lines.append("# Set the target options:")
@@ -447,17 +544,16 @@ def _get_mapping(source_dataset: dict, sink_dataset: dict, column_mapping: dict,
     """
     source_name = source_dataset.get("dataset_name")
     sink_name = sink_dataset.get("dataset_name")
-    expressions = []
-    for mapping in column_mapping:
-        source_col = mapping["source_column_name"]
-        sink_col = mapping["sink_column_name"]
-        sink_type = parse_spark_data_type(mapping["sink_column_type"], sink_dataset["type"])
-        if cast_column_types:
-            expressions.append(f'"cast({source_col} as {sink_type}) as {sink_col}"')
-        else:
-            expressions.append(f'"{source_col} as {sink_col}"')
-    newline_characters = ", \n\t"
-    return f"{sink_name}_df = {source_name}_df.selectExpr(\n\t{newline_characters.join(expressions)}\n)"
+    template = _CAST_COLUMN_TEMPLATE if cast_column_types else _RENAME_COLUMN_TEMPLATE
+    expressions = _COLUMN_SEPARATOR.join(
+        template(
+            source_column=mapping["source_column_name"],
+            sink_column=mapping["sink_column_name"],
+            sink_type=parse_spark_data_type(mapping["sink_column_type"], sink_dataset["type"]),
+        )
+        for mapping in column_mapping
+    )
+    return f"{sink_name}_df = {source_name}_df.selectExpr(\n\t{expressions}\n)"
 
 
 def _get_write_expression(sink_definition: dict) -> str:
@@ -473,65 +569,11 @@ def _get_write_expression(sink_definition: dict) -> str:
     Raises:
         ValueError: If the sink dataset type is not supported.
     """
-    sink_name = sink_definition.get("dataset_name")
     sink_type = sink_definition.get("type")
-    if sink_type == "avro":
-        container_name = sink_definition.get("container")
-        storage_account_name = sink_definition.get("storage_account_name")
-        folder_path = sink_definition.get("folder_path")
-        return rf"""{sink_name}_df.write.format("avro")  \
-                        .mode("overwrite")  \
-                        .save("abfss://{container_name}@{storage_account_name}.dfs.core.windows.net/{folder_path}")
-                    """
-    if sink_type == "csv":
-        container_name = sink_definition.get("container")
-        storage_account_name = sink_definition.get("storage_account_name")
-        folder_path = sink_definition.get("folder_path")
-        return rf"""{sink_name}_df.write.format("csv")  \
-                        .options(**{sink_name}_options)  \
-                        .mode("overwrite")  \
-                        .save("abfss://{container_name}@{storage_account_name}.dfs.core.windows.net/{folder_path}")
-                    """
-    if sink_type == "delta":
-        database_name = sink_definition.get("database_name")
-        table_name = sink_definition.get("table_name")
-        return rf"""{sink_name}_df.write.format("delta")  \
-                        .mode("overwrite")  \
-                        .saveAsTable("hive_metastore.{database_name}.{table_name}")
-                    """
-    if sink_type == "json":
-        container_name = sink_definition.get("container")
-        storage_account_name = sink_definition.get("storage_account_name")
-        folder_path = sink_definition.get("folder_path")
-        return rf"""{sink_name}_df.write.format("json")  \
-                        .options(**{sink_name}_options)  \
-                        .mode("overwrite")  \
-                        .save("abfss://{container_name}@{storage_account_name}.dfs.core.windows.net/{folder_path}")
-                    """
-    if sink_type == "orc":
-        container_name = sink_definition.get("container")
-        storage_account_name = sink_definition.get("storage_account_name")
-        folder_path = sink_definition.get("folder_path")
-        return rf"""{sink_name}_df.write.format("orc")  \
-                        .options(**{sink_name}_options)  \
-                        .mode("overwrite")  \
-                        .save("abfss://{container_name}@{storage_account_name}.dfs.core.windows.net/{folder_path}")
-                    """
-    if sink_type == "parquet":
-        container_name = sink_definition.get("container")
-        storage_account_name = sink_definition.get("storage_account_name")
-        folder_path = sink_definition.get("folder_path")
-        return rf"""{sink_name}_df.write.format("parquet")  \
-                        .options(**{sink_name}_options)  \
-                        .mode("overwrite")  \
-                        .save("abfss://{container_name}@{storage_account_name}.dfs.core.windows.net/{folder_path}")
-                    """
-    if sink_type == "sqlserver":
-        return rf"""{sink_name}_df.write.format("jdbc")  \
-                        .options(**{sink_name}_options)  \
-                        .save()
-                    """
-    raise ValueError(f'Writing data to "{sink_type}" not supported')
+    template = _WRITE_TEMPLATES.get(sink_type)
+    if template is None:
+        raise ValueError(f'Writing data to "{sink_type}" not supported')
+    return template.substitute(_get_template_values(sink_definition))
 
 
 def _get_read_expression(source_definition: dict) -> str:
@@ -547,72 +589,33 @@ def _get_read_expression(source_definition: dict) -> str:
     Raises:
         ValueError: If the source dataset type is not supported.
     """
-    source_name = source_definition.get("dataset_name")
     source_type = source_definition.get("type")
-    if source_type == "avro":
-        container_name = source_definition.get("container")
-        storage_account_name = source_definition.get("storage_account_name")
-        folder_path = source_definition.get("folder_path")
-        return f"""{source_name}_df = ( 
-                        spark.read.format("avro")
-                            .load("abfss://{container_name}@{storage_account_name}.dfs.core.windows.net/{folder_path}")
-                    )
-                    """
-    if source_type == "csv":
-        container_name = source_definition.get("container")
-        storage_account_name = source_definition.get("storage_account_name")
-        folder_path = source_definition.get("folder_path")
-        return f"""{source_name}_df = ( 
-                        spark.read.format("csv")
-                            .options(**{source_name}_options)
-                            .load("abfss://{container_name}@{storage_account_name}.dfs.core.windows.net/{folder_path}")
-                        )
-                    """
-    if source_type == "delta":
-        database_name = source_definition.get("database_name")
-        table_name = source_definition.get("table_name")
-        return f'{source_name}_df = spark.read.table("hive_metastore.{database_name}.{table_name}'
-    if source_type == "json":
-        container_name = source_definition.get("container")
-        storage_account_name = source_definition.get("storage_account_name")
-        folder_path = source_definition.get("folder_path")
-        return f"""{source_name}_df = ( 
-                        spark.read.format("json")
-                            .options(**{source_name}_options)
-                            .load("abfss://{container_name}@{storage_account_name}.dfs.core.windows.net/{folder_path}")
-                        )
-                    """
-    if source_type == "orc":
-        container_name = source_definition.get("container")
-        storage_account_name = source_definition.get("storage_account_name")
-        folder_path = source_definition.get("folder_path")
-        return f"""{source_name}_df = ( 
-                        spark.read.format("orc")
-                            .options(**{source_name}_options)
-                            .load("abfss://{container_name}@{storage_account_name}.dfs.core.windows.net/{folder_path}")
-                        )
-                    """
-    if source_type == "parquet":
-        container_name = source_definition.get("container")
-        storage_account_name = source_definition.get("storage_account_name")
-        folder_path = source_definition.get("folder_path")
-        return f"""{source_name}_df = ( 
-                        spark.read.format("parquet")
-                            .options(**{source_name}_options)
-                            .load("abfss://{container_name}@{storage_account_name}.dfs.core.windows.net/{folder_path}")
-                        )
-                    """
-    if source_type == "sqlserver":
-        schema_name = source_definition.get("schema_name")
-        table_name = source_definition.get("table_name")
-        return f"""{source_name}_df = ( 
-                    spark.read.format("sqlserver")
-                        .options(**{source_name}_options)
-                        .option("dbtable", "{schema_name}.{table_name}")
-                        .load()
-                    )
-                    """
-    raise ValueError(f'Reading data from "{source_type}" not supported')
+    template = _READ_TEMPLATES.get(source_type)
+    if template is None:
+        raise ValueError(f'Reading data from "{source_type}" not supported')
+    return template.substitute(_get_template_values(source_definition))
+
+
+def _get_template_values(dataset_definition: dict) -> dict[str, Any]:
+    """
+    Returns the values substituted into the read and write expression templates.
+
+    Args:
+        dataset_definition: Resolved dataset definition.
+
+    Returns:
+        Template substitution values as a ``dict[str, Any]``.
+    """
+    return {
+        "dataset_name": dataset_definition.get("dataset_name"),
+        "dataset_type": dataset_definition.get("type"),
+        "container_name": dataset_definition.get("container"),
+        "storage_account_name": dataset_definition.get("storage_account_name"),
+        "folder_path": dataset_definition.get("folder_path"),
+        "database_name": dataset_definition.get("database_name"),
+        "schema_name": dataset_definition.get("schema_name"),
+        "table_name": dataset_definition.get("table_name"),
+    }
 
 
 def _get_option_expressions(dataset_definition: dict) -> list[str]:
@@ -655,14 +658,9 @@ def _get_file_options(dataset_definition: dict, file_type: str) -> list[str]:
         records_per_file = dataset_definition.get("records_per_file")
         config_lines.append(f'spark.conf.set("spark.sql.files.maxRecordsPerFile", "{records_per_file}")')
     config_lines.append(
-        f"""spark.conf.set(
-                "fs.azure.account.key.{dataset_definition.get('storage_account_name')}.dfs.core.windows.net",
-                    dbutils.secrets.get(
-                        scope="wkmigrate_credentials_scope", 
-                        key="{service_name}_storage_account_key"
-                )
-            )
-            """
+        _STORAGE_ACCOUNT_KEY_TEMPLATE.substitute(
+            storage_account_name=dataset_definition.get("storage_account_name"), service_name=service_name
+        )
     )
     return [f"{dataset_name}_options = {{}}", *config_lines]
 
@@ -681,11 +679,7 @@ def _get_database_options(dataset_definition: dict, database_type: str) -> list[
     dataset_name = dataset_definition.get("dataset_name")
     service_name = dataset_definition.get("service_name")
     secrets_lines = [
-        f"""{dataset_name}_options["{secret}"] = dbutils.secrets.get(
-                scope="wkmigrate_credentials_scope", 
-                key="{service_name}_{secret}"
-            )
-            """
+        _SECRET_OPTION_TEMPLATE.substitute(dataset_name=dataset_name, secret=secret, service_name=service_name)
         for secret in secrets[database_type]
     ]
     options_lines = [
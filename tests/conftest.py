@@ -3,22 +3,47 @@
 from __future__ import annotations
 
 import json
-import os
+from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from wkmigrate.definition_stores import factory_definition_store, workspace_definition_store
 
-JSON_PATH = os.path.join(os.path.dirname(__file__), "resources", "json")
-YAML_PATH = os.path.join(os.path.dirname(__file__), "resources", "yaml")
+if TYPE_CHECKING:
+    from wkmigrate.definition_stores.workspace_definition_store import WorkspaceDefinitionStore
+
+JSON_PATH = Path(__file__).parent / "resources" / "json"
+YAML_PATH = Path(__file__).parent / "resources" / "yaml"
 
 
 @dataclass
 class MockFactoryClient:
-    """Mock FactoryClient double backed by JSON fixtures."""
+    """Mock FactoryClient double backed by JSON fixtures, parsed once on first use."""
+
+    test_json_path: Path = JSON_PATH
+
+    @cached_property
+    def _pipelines(self) -> dict[str, dict]:
+        return {pipeline.get("name"): pipeline for pipeline in self._load("test_pipelines.json")}
+
+    @cached_property
+    def _triggers(self) -> list[dict]:
+        return self._load("test_triggers.json")
 
-    test_json_path: str = JSON_PATH
+    @cached_property
+    def _datasets(self) -> dict[str, dict]:
+        return {dataset.get("name"): dataset for dataset in self._load("test_datasets.json")}
+
+    @cached_property
+    def _linked_services(self) -> dict[str, dict]:
+        linked_services = self._load("test_linked_services.json")
+        return {linked_service.get("name"): linked_service for linked_service in linked_services}
+
+    def _load(self, file_name: str) -> list[dict]:
+        with open(self.test_json_path / file_name, "rb") as file:
+            return json.load(file)
 
     def get_pipeline(self, pipeline_name: str) -> dict:
         """Return a pipeline definition.
@@ -32,11 +57,9 @@ class MockFactoryClient:
         Raises:
             ValueError: If no pipeline matches the provided name.
         """
-        with open(f"{self.test_json_path}/test_pipelines.json", "rb") as file:
-            pipelines = json.load(file)
-        for pipeline in pipelines:
-            if pipeline.get("name") == pipeline_name:
-                return pipeline
+        pipeline = self._pipelines.get(pipeline_name)
+        if pipeline is not None:
+            return deepcopy(pipeline)
         raise ValueError(f'No pipeline found with name "{pipeline_name}"')
 
     def get_trigger(self, pipeline_name: str) -> dict:
@@ -51,9 +74,7 @@ class MockFactoryClient:
         Raises:
             ValueError: If no trigger is associated with the pipeline.
         """
-        with open(f"{self.test_json_path}/test_triggers.json", "rb") as file:
-            triggers = json.load(file)
-        for trigger in triggers:
+        for trigger in self._triggers:
             properties = trigger.get("properties")
             if not properties:
                 continue
@@ -65,7 +86,7 @@ class MockFactoryClient:
                 and reference.get("type") == "PipelineReference"
             ]
             if pipeline_name in pipeline_names:
-                return trigger
+                return deepcopy(trigger)
         raise ValueError(f'No trigger found for pipeline with name "{pipeline_name}"')
 
     def get_dataset(self, dataset_name: str) -> dict:
@@ -81,19 +102,19 @@ class MockFactoryClient:
         Raises:
             ValueError: If no dataset matches ``dataset_name``.
         """
-        with open(f"{self.test_json_path}/test_datasets.json", "rb") as file:
-            datasets = json.load(file)
-        for dataset in datasets:
-            properties = dataset.get("properties")
-            if not properties:
-                return dataset
-            linked_service_ref = properties.get("linked_service_name")
-            if linked_service_ref is None:
-                return dataset
-            linked_service_name = linked_service_ref.get("reference_name")
-            dataset["linked_service_definition"] = self.get_linked_service(linked_service_name)
+        dataset = self._datasets.get(dataset_name)
+        if dataset is None:
+            raise ValueError(f'No dataset found for factory with name "{dataset_name}"')
+        dataset = deepcopy(dataset)
+        properties = dataset.get("properties")
+        if not properties:
             return dataset
-        raise ValueError(f'No dataset found for factory with name "{dataset_name}"')
+        linked_service_ref = properties.get("linked_service_name")
+        if linked_service_ref is None:
+            return dataset
+        linked_service_name = linked_service_ref.get("reference_name")
+        dataset["linked_service_definition"] = self.get_linked_service(linked_service_name)
+        return dataset
 
     def get_linked_service(self, linked_service_name: str) -> dict:
         """
@@ -108,22 +129,32 @@ class MockFactoryClient:
         Raises:
             ValueError: If the linked service does not exist in fixtures.
         """
-        with open(f"{self.test_json_path}/test_linked_services.json", "rb") as file:
-            linked_services = json.load(file)
-        for linked_service in linked_services:
-            if linked_service.get("name") == linked_service_name:
-                return linked_service
+        linked_service = self._linked_services.get(linked_service_name)
+        if linked_service is not None:
+            return deepcopy(linked_service)
         raise ValueError(f'No linked service found with name "{linked_service_name}"')
 
 
+@pytest.fixture(scope="session")
+def factory_client_delegate() -> MockFactoryClient:
+    """
+    Provides the JSON-backed ``MockFactoryClient``. It holds no per-test state, so it is built once
+    per session and its parsed fixture files are shared by every test.
+    """
+    return MockFactoryClient()
+
+
 @pytest.fixture
-def mock_factory_client(monkeypatch: pytest.MonkeyPatch) -> MockFactoryClient:
+def mock_factory_client(
+    factory_client_delegate: MockFactoryClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> MockFactoryClient:
     """
     Provides a FactoryClient double backed by JSON fixtures and patches the concrete client
     used by ``FactoryDefinitionStore`` so tests never talk to real Azure resources.
     """
 
-    delegate = MockFactoryClient()
+    delegate = factory_client_delegate
 
     class _FakeFactoryClient:
         def __init__(self, **_: Any) -> None:
@@ -141,7 +172,7 @@ def mock_factory_client(monkeypatch: pytest.MonkeyPatch) -> MockFactoryClient:
         def get_linked_service(self, linked_service_name: str) -> dict:
             return self._delegate.get_linked_service(linked_service_name)
 
-    monkeypatch.setattr(factory_definition_store, "FactoryClient", _FakeFactoryClient)
+    monkeypatch.setattr("wkmigrate.definition_stores.factory_definition_store.FactoryClient", _FakeFactoryClient)
     return delegate
 
 
@@ -168,7 +199,7 @@ class _MockJobsAPI:
         """Create a mock job entry."""
         job_id = self._counter
         self._counter += 1
-        job = _MockJob(job_id=job_id, settings=payload.get("settings", {}))
+        job = _MockJob(job_id=job_id, settings=dict(payload))
         self._jobs[job_id] = job
         return type("JobResponse", (), {"job_id": job_id})()
 
@@ -188,17 +219,21 @@ class _MockWorkspaceAPI:
 
     def __init__(self) -> None:
         self._files: set[str] = set()
+        self.uploads: list[str] = []
+        self.get_status_calls = 0
 
     def mkdirs(self, path: str) -> None:
         """Record a directory creation call."""
         self._files.add(path)
 
-    def import_(self, *, path: str, **_: Any) -> None:
-        """Record a notebook import call."""
+    def upload(self, path: str, content: Any, **_: Any) -> None:
+        """Record a notebook upload call."""
         self._files.add(path)
+        self.uploads.append(path)
 
     def get_status(self, *, path: str) -> dict[str, str]:
         """Return a mock notebook status response."""
+        self.get_status_calls += 1
         if path not in self._files:
             raise FileNotFoundError(path)
         return {"path": path}
@@ -222,6 +257,8 @@ class _MockScopesAPI:
 
     def __init__(self) -> None:
         self._scopes: dict[str, dict[str, str]] = {}
+        self.created_scopes: list[str] = []
+        self.put_secret_calls = 0
 
     def list_scopes(self) -> list[Any]:
         """Return existing scopes."""
@@ -229,10 +266,16 @@ class _MockScopesAPI:
 
     def create_scope(self, scope: str) -> None:
         """Create a secret scope."""
+        self.created_scopes.append(scope)
         self._scopes.setdefault(scope, {})
 
+    def delete_scope(self, scope: str) -> None:
+        """Delete a secret scope."""
+        del self._scopes[scope]
+
     def put_secret(self, *, scope: str, key: str, string_value: str) -> None:
         """Store a secret value."""
+        self.put_secret_calls += 1
         self._scopes.setdefault(scope, {})[key] = string_value
 
 
@@ -247,7 +290,7 @@ class MockWorkspaceClient:
 
 
 @pytest.fixture
-def mock_workspace_client() -> MockWorkspaceClient:
+def mock_workspace_client(monkeypatch: pytest.MonkeyPatch) -> MockWorkspaceClient:
     """
     Provides a WorkspaceClient double for testing and patches the workspace login helper
     so ``WorkspaceDefinitionStore`` instances use this mock instead of a real workspace client.
@@ -255,8 +298,11 @@ def mock_workspace_client() -> MockWorkspaceClient:
 
     delegate = MockWorkspaceClient()
 
-    def _fake_login(_: workspace_definition_store.WorkspaceDefinitionStore) -> MockWorkspaceClient:
+    def _fake_login(_: WorkspaceDefinitionStore) -> MockWorkspaceClient:
         return delegate
 
-    workspace_definition_store.WorkspaceDefinitionStore._login_workspace_client = _fake_login  # type: ignore[assignment]
+    monkeypatch.setattr(
+        "wkmigrate.definition_stores.workspace_definition_store.WorkspaceDefinitionStore._login_workspace_client",
+        _fake_login,
+    )
     return delegate
@@ -13,6 +13,9 @@ from wkmigrate.activity_translators.parsers import (
 from wkmigrate.models.ir.activities import ColumnMapping, Dependency
 
 
+DOES_NOT_RAISE = does_not_raise()
+
+
 class TestActivityParsers:
     """Unit tests for the activity parsing methods."""
 
@@ -20,7 +23,7 @@ class TestActivityParsers:
         "column_mapping, expected_result, context",
         [
             (None, None, pytest.raises(AttributeError, match="'NoneType' object has no attribute 'get'")),
-            ({}, [], does_not_raise()),
+            ({}, [], DOES_NOT_RAISE),
             (
                 {
                     "mappings": [
@@ -28,7 +31,7 @@ class TestActivityParsers:
                     ]
                 },
                 [ColumnMapping(source_column_name="col1", sink_column_name="col1", sink_column_type="string")],
-                does_not_raise(),
+                DOES_NOT_RAISE,
             ),
         ],
     )
@@ -39,9 +42,9 @@ class TestActivityParsers:
     @pytest.mark.parametrize(
         "for_each_items, expected_result, context",
         [
-            ({"value": "@array('1,2,3')"}, '["1","2","3"]', does_not_raise()),
-            ({"value": '@array(\'"a","b","c"\')'}, '["a","b","c"]', does_not_raise()),
-            ({"value": "not_an_array"}, None, does_not_raise()),
+            ({"value": "@array('1,2,3')"}, '["1","2","3"]', DOES_NOT_RAISE),
+            ({"value": '@array(\'"a","b","c"\')'}, '["a","b","c"]', DOES_NOT_RAISE),
+            ({"value": "not_an_array"}, None, DOES_NOT_RAISE),
         ],
     )
     def test_parse_for_each_items(self, for_each_items, expected_result, context):
@@ -51,7 +54,7 @@ class TestActivityParsers:
     @pytest.mark.parametrize(
         "policy_definition, expected_result, context",
         [
-            (None, {}, does_not_raise()),
+            (None, {}, DOES_NOT_RAISE),
             (
                 {"timeout": "0.01:30:00", "retry": 3, "retry_interval_in_seconds": 60},
                 {
@@ -59,7 +62,7 @@ class TestActivityParsers:
                     "max_retries": 3,
                     "min_retry_interval_millis": 60000,
                 },
-                does_not_raise(),
+                DOES_NOT_RAISE,
             ),
         ],
     )
@@ -70,11 +73,11 @@ class TestActivityParsers:
     @pytest.mark.parametrize(
         "dependencies, expected_result, context",
         [
-            (None, None, does_not_raise()),
+            (None, None, DOES_NOT_RAISE),
             (
                 [{"activity": "Task1", "dependencyConditions": ["Succeeded"]}],
                 [Dependency(task_key="Task1", outcome=None)],
-                does_not_raise(),
+                DOES_NOT_RAISE,
             ),
             (
                 [
@@ -116,12 +119,12 @@ class TestActivityParsers:
             (
                 {"value": "@equals(1, 1)"},
                 {"op": "EQUAL_TO", "left": "1", "right": "1"},
-                does_not_raise(),
+                DOES_NOT_RAISE,
             ),
             (
                 {"value": "@greater(2, 1)"},
                 {"op": "GREATER_THAN", "left": "2", "right": "1"},
-                does_not_raise(),
+                DOES_NOT_RAISE,
             ),
         ],
     )
@@ -4,6 +4,9 @@ from wkmigrate.activity_translators.activity_translator import translate_activit
 from wkmigrate.models.ir.activities import DatabricksNotebookActivity, Dependency, IfConditionActivity
 
 
+DOES_NOT_RAISE = does_not_raise()
+
+
 class TestActivityTranslator:
     """Unit tests for the activity translator methods."""
 
@@ -164,7 +167,7 @@ class TestActivityTranslator:
                     depends_on=[],
                     notebook_path="/path/to/notebook",
                 ),
-                does_not_raise(),
+                DOES_NOT_RAISE,
             ),
             (
                 {
@@ -11,16 +11,19 @@ from wkmigrate.datasets.parsers import (
 )
 
 
+DOES_NOT_RAISE = does_not_raise()
+
+
 class TestDatasetParsers:
     """Unit tests for dataset-level parsing helpers."""
 
     @pytest.mark.parametrize(
         "properties, expected_result, context",
         [
-            (None, 0, does_not_raise()),
-            ({}, 0, does_not_raise()),
-            ({"query_timeout": "00:05:00"}, 300, does_not_raise()),
-            ({"query_timeout": "02:30:00"}, 9000, does_not_raise()),
+            (None, 0, DOES_NOT_RAISE),
+            ({}, 0, DOES_NOT_RAISE),
+            ({"query_timeout": "00:05:00"}, 300, DOES_NOT_RAISE),
+            ({"query_timeout": "02:30:00"}, 9000, DOES_NOT_RAISE),
         ],
     )
     def test_parse_query_timeout_seconds(self, properties, expected_result, context):
@@ -30,10 +33,10 @@ class TestDatasetParsers:
     @pytest.mark.parametrize(
         "properties, expected_result, context",
         [
-            (None, "READ_COMMITTED", does_not_raise()),
-            ({}, "READ_COMMITTED", does_not_raise()),
-            ({"isolation_level": "ReadCommitted"}, IsolationLevel.READ_COMMITTED.name, does_not_raise()),
-            ({"isolation_level": "Serializable"}, IsolationLevel.SERIALIZABLE.name, does_not_raise()),
+            (None, "READ_COMMITTED", DOES_NOT_RAISE),
+            ({}, "READ_COMMITTED", DOES_NOT_RAISE),
+            ({"isolation_level": "ReadCommitted"}, IsolationLevel.READ_COMMITTED.name, DOES_NOT_RAISE),
+            ({"isolation_level": "Serializable"}, IsolationLevel.SERIALIZABLE.name, DOES_NOT_RAISE),
         ],
     )
     def test_parse_query_isolation_level(self, properties, expected_result, context):
@@ -1,8 +1,61 @@
+from dataclasses import replace
+
 import pytest
 
 from wkmigrate.definition_stores.definition_store import DefinitionStore
 from wkmigrate.definition_stores.factory_definition_store import FactoryDefinitionStore
 from wkmigrate.definition_stores.workspace_definition_store import WorkspaceDefinitionStore
+from wkmigrate.models.workflows.artifacts import NotebookArtifact
+from wkmigrate.models.workflows.instructions import SecretInstruction
+
+
+NOTEBOOK = NotebookArtifact(file_path="/wkmigrate/copy_data_notebooks/copy_source_to_sink", content="print('copy')")
+
+
+PASSWORD_SECRET = SecretInstruction(
+    scope="wkmigrate_credentials_scope",
+    key="sql_linked_service_password",
+    service_name="sql_linked_service",
+    service_type="sqlserver",
+    provided_value="FIRST_PASSWORD",
+    user_input_required=False,
+)
+
+
+SECRETS = [
+    PASSWORD_SECRET,
+    replace(PASSWORD_SECRET, provided_value="SECOND_PASSWORD"),
+    replace(PASSWORD_SECRET, key="sql_linked_service_user_name", provided_value=None, user_input_required=True),
+]
+
+
+NOTEBOOK_TASK = {
+    "task_key": "notebook",
+    "type": "DatabricksNotebook",
+    "notebook_task": {"notebook_path": "/Shared/notebook"},
+}
+
+
+EMPTY_PIPELINE = {"name": "WORKFLOW", "parameters": None, "schedule": None, "tasks": [], "tags": {}}
+
+
+NOTEBOOK_UPLOAD_CASES = (
+    pytest.param([NOTEBOOK], [NOTEBOOK], 1, id="unchanged"),
+    pytest.param([NOTEBOOK, NOTEBOOK], [], 1, id="duplicate-in-batch"),
+    pytest.param([NOTEBOOK], [replace(NOTEBOOK, content="print('changed')")], 2, id="changed-content"),
+    pytest.param([NOTEBOOK], [replace(NOTEBOOK, language="scala")], 2, id="changed-language"),
+)
+
+
+@pytest.fixture
+def workspace_definition_store(mock_workspace_client) -> WorkspaceDefinitionStore:
+    """Provides a ``WorkspaceDefinitionStore`` wired to the mock workspace client."""
+    assert mock_workspace_client is not None
+    return WorkspaceDefinitionStore(
+        authentication_type="pat",
+        host_name="https://example.com",
+        pat="DUMMY_TOKEN",
+    )
 
 
 class TestDefinitionStoreContracts:
@@ -65,3 +118,103 @@ class TestDefinitionStoreContracts:
         # The mocked jobs API starts empty; loading a non-existent workflow should raise a ValueError.
         with pytest.raises(ValueError):
             store.load("WORKFLOW")
+
+
+class TestWorkspaceDefinitionStore:
+    """Unit tests for ``WorkspaceDefinitionStore`` workspace interactions."""
+
+    @pytest.mark.parametrize("first_batch, second_batch, expected_uploads", NOTEBOOK_UPLOAD_CASES)
+    def test_upload_notebooks_skips_unchanged_notebooks(
+        self,
+        workspace_definition_store,
+        mock_workspace_client,
+        first_batch,
+        second_batch,
+        expected_uploads,
+    ) -> None:
+        """Notebooks are only uploaded again when their language or content changes."""
+        workspace_definition_store._upload_notebooks(mock_workspace_client, first_batch)
+        workspace_definition_store._upload_notebooks(mock_workspace_client, second_batch)
+        assert mock_workspace_client.workspace.uploads == [NOTEBOOK.file_path] * expected_uploads
+
+    def test_to_pipeline_uploads_and_checks_notebooks_again(
+        self, workspace_definition_store, mock_workspace_client
+    ) -> None:
+        """Uploads and notebook checks from an earlier workflow are not reused, since the workspace may have changed."""
+        mock_workspace_client.workspace.mkdirs("/Workspace/Shared/notebook")
+        workspace_definition_store._upload_notebooks(mock_workspace_client, [NOTEBOOK])
+        workspace_definition_store._ensure_notebook_dependencies(mock_workspace_client, [NOTEBOOK_TASK])
+        workspace_definition_store.to_pipeline(EMPTY_PIPELINE)
+        workspace_definition_store._upload_notebooks(mock_workspace_client, [NOTEBOOK])
+        workspace_definition_store._ensure_notebook_dependencies(mock_workspace_client, [NOTEBOOK_TASK])
+        assert mock_workspace_client.workspace.uploads == [NOTEBOOK.file_path] * 2
+        assert mock_workspace_client.workspace.get_status_calls == 2
+
+    def test_load_detects_duplicate_created_after_lookup(
+        self, workspace_definition_store, mock_workspace_client
+    ) -> None:
+        """A job created elsewhere with an already looked-up name is reported as a duplicate on the next lookup."""
+        mock_workspace_client.jobs.create(name="WORKFLOW")
+        workspace_definition_store.load("WORKFLOW")
+        mock_workspace_client.jobs.create(name="WORKFLOW")
+        with pytest.raises(ValueError, match="Duplicate workflows"):
+            workspace_definition_store.load("WORKFLOW")
+
+    def test_materialize_secrets_writes_each_key_once(self, workspace_definition_store, mock_workspace_client) -> None:
+        """Each scope/key pair is written once with the last provided value, and the scope is created once."""
+        workspace_definition_store._materialize_secrets(mock_workspace_client, SECRETS)
+        workspace_definition_store._materialize_secrets(mock_workspace_client, SECRETS)
+        assert mock_workspace_client.secrets.created_scopes == ["wkmigrate_credentials_scope"]
+        assert mock_workspace_client.secrets.put_secret_calls == 4
+        assert mock_workspace_client.secrets._scopes == {
+            "wkmigrate_credentials_scope": {
+                "sql_linked_service_password": "SECOND_PASSWORD",
+                "sql_linked_service_user_name": "PLACEHOLDER_SECRET_VALUE",
+            }
+        }
+
+    def test_materialize_secrets_reuses_existing_scope(self, workspace_definition_store, mock_workspace_client) -> None:
+        """An existing credentials scope is not created again."""
+        mock_workspace_client.secrets._scopes["wkmigrate_credentials_scope"] = {}
+        workspace_definition_store._materialize_secrets(mock_workspace_client, SECRETS)
+        assert not mock_workspace_client.secrets.created_scopes
+
+    def test_to_pipeline_relists_secret_scopes(self, workspace_definition_store, mock_workspace_client) -> None:
+        """A scope deleted between workflows is created again instead of being trusted from an earlier listing."""
+        workspace_definition_store._materialize_secrets(mock_workspace_client, SECRETS)
+        mock_workspace_client.secrets.delete_scope("wkmigrate_credentials_scope")
+        workspace_definition_store.to_pipeline(EMPTY_PIPELINE)
+        workspace_definition_store._materialize_secrets(mock_workspace_client, SECRETS)
+        assert mock_workspace_client.secrets.created_scopes == ["wkmigrate_credentials_scope"] * 2
+
+    def test_list_secret_scopes_ignores_unnamed_scopes(
+        self,
+        workspace_definition_store,
+        mock_workspace_client,
+        monkeypatch,
+    ) -> None:
+        """Scopes returned without a name are not included in the cached scope names."""
+        scopes = [type("Scope", (), {"name": name})() for name in ("wkmigrate_credentials_scope", None)]
+        monkeypatch.setattr(mock_workspace_client.secrets, "list_scopes", lambda: scopes)
+        assert workspace_definition_store._list_secret_scopes(mock_workspace_client) == {"wkmigrate_credentials_scope"}
+
+    def test_ensure_notebook_dependencies_checks_existing_notebooks_once(
+        self,
+        workspace_definition_store,
+        mock_workspace_client,
+    ) -> None:
+        """Notebooks found in the workspace are not checked again."""
+        mock_workspace_client.workspace.mkdirs("/Workspace/Shared/notebook")
+        workspace_definition_store._ensure_notebook_dependencies(mock_workspace_client, [NOTEBOOK_TASK, NOTEBOOK_TASK])
+        assert mock_workspace_client.workspace.get_status_calls == 1
+
+    def test_ensure_notebook_dependencies_rechecks_missing_notebooks(
+        self,
+        workspace_definition_store,
+        mock_workspace_client,
+    ) -> None:
+        """Missing notebooks are reported on every check and are not cached as existing."""
+        tasks = [NOTEBOOK_TASK, NOTEBOOK_TASK]
+        with pytest.warns(UserWarning, match="not found in target workspace"):
+            workspace_definition_store._ensure_notebook_dependencies(mock_workspace_client, tasks)
+        assert mock_workspace_client.workspace.get_status_calls == 2
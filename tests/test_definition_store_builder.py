@@ -5,6 +5,19 @@ from wkmigrate.definition_stores.definition_store_builder import build_definitio
 from wkmigrate.definition_stores.definition_store import DefinitionStore
 
 
+DOES_NOT_RAISE = does_not_raise()
+
+
+REQUIRED_FACTORY_OPTIONS = (
+    "tenant_id",
+    "client_id",
+    "client_secret",
+    "subscription_id",
+    "resource_group_name",
+    "factory_name",
+)
+
+
 DEFINITION_STORE_CASES = [
     # FactoryDefinitionStore: missing options
     ("factory_definition_store", None, pytest.raises(ValueError)),
@@ -19,7 +32,7 @@ DEFINITION_STORE_CASES = [
             "resource_group_name": "RESOURCE_GROUP",
             "factory_name": "FACTORY_NAME",
         },
-        does_not_raise(),
+        DOES_NOT_RAISE,
     ),
     # WorkspaceDefinitionStore: missing options
     ("workspace_definition_store", None, pytest.raises(ValueError)),
@@ -31,7 +44,7 @@ DEFINITION_STORE_CASES = [
             "host_name": "https://example.com",
             "pat": "DUMMY_TOKEN",
         },
-        does_not_raise(),
+        DOES_NOT_RAISE,
     ),
     # Edge cases: unknown / empty type
     ("invalid_definition_store", {}, pytest.raises(ValueError)),
@@ -42,26 +55,6 @@ DEFINITION_STORE_CASES = [
 class TestDefinitionStoreBuilder:
     """Unit tests for the build_definition_store method."""
 
-    @pytest.mark.parametrize(
-        "definition_store_type, definition_store_options, expected_result",
-        DEFINITION_STORE_CASES,
-    )
-    def test_definition_store_builder_returns_object(
-        self,
-        definition_store_type: str,
-        definition_store_options: dict,
-        expected_result: Exception,
-        mock_factory_client,
-    ) -> None:
-        """Tests that the definition store builder returns a non-null object."""
-        assert mock_factory_client is not None
-        with expected_result:
-            store = build_definition_store(
-                definition_store_type=definition_store_type,
-                options=definition_store_options,
-            )
-            assert store is not None, 'Method build_definition_store returned "None"'
-
     @pytest.mark.parametrize(
         "definition_store_type, definition_store_options, expected_result",
         DEFINITION_STORE_CASES,
@@ -70,11 +63,13 @@ class TestDefinitionStoreBuilder:
         self,
         definition_store_type: str,
         definition_store_options: dict,
-        expected_result: callable,
+        expected_result,
         mock_factory_client,
+        mock_workspace_client,
     ) -> None:
-        """Tests that the definition store builder returns a DefinitionStore object."""
+        """Tests that the definition store builder returns a DefinitionStore object or raises the expected error."""
         assert mock_factory_client is not None
+        assert mock_workspace_client is not None
         with expected_result:
             store = build_definition_store(
                 definition_store_type=definition_store_type,
@@ -83,3 +78,10 @@ class TestDefinitionStoreBuilder:
             assert isinstance(
                 store, DefinitionStore
             ), 'Method build_definition_store did not return a "DefinitionStore" object'
+
+    @pytest.mark.parametrize("num_options", range(len(REQUIRED_FACTORY_OPTIONS)))
+    def test_factory_definition_store_missing_required_options(self, num_options: int) -> None:
+        """Tests that the definition store builder rejects factory options missing any required key."""
+        options = {key: key.upper() for key in REQUIRED_FACTORY_OPTIONS[:num_options]}
+        with pytest.raises(ValueError):
+            build_definition_store(definition_store_type="factory_definition_store", options=options)
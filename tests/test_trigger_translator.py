@@ -14,159 +14,271 @@ from wkmigrate.trigger_translators.schedule_trigger_translator import (
 )
 
 
-class TestTriggerTranslator:
-    """Unit tests for trigger translator methods."""
-
-    @pytest.mark.parametrize(
-        "trigger_definition, expected_result",
-        [
-            (
-                {
-                    "properties": {
-                        "recurrence": {
-                            "frequency": "Day",
-                            "interval": 1,
-                            "schedule": {"hours": [9], "minutes": [0]},
-                        },
-                        "time_zone": "Eastern Standard Time",
-                    }
-                },
-                {"quartz_cron_expression": "0 0 9 */1 * ?", "timezone_id": "UTC"},
-            ),
-            (
-                {
-                    "properties": {
-                        "recurrence": {
-                            "frequency": "Day",
-                            "interval": 2,
-                            "schedule": {"hours": [9], "minutes": [23]},
-                        },
-                        "time_zone": "Eastern Standard Time",
-                    }
-                },
-                {"quartz_cron_expression": "0 23 9 */2 * ?", "timezone_id": "UTC"},
-            ),
-            (
-                {
-                    "properties": {
-                        "recurrence": {"frequency": "Hour", "interval": 1},
-                        "time_zone": "Eastern Standard Time",
-                    }
-                },
-                {"quartz_cron_expression": "0 0 */1 * * ?", "timezone_id": "UTC"},
-            ),
-            (
-                {
-                    "properties": {
-                        "recurrence": {"frequency": "Hour", "interval": 5},
-                        "time_zone": "Eastern Standard Time",
-                    }
-                },
-                {"quartz_cron_expression": "0 0 */5 * * ?", "timezone_id": "UTC"},
-            ),
-            (
-                {
-                    "properties": {
-                        "recurrence": {"frequency": "Week", "interval": 1},
-                        "time_zone": "Eastern Standard Time",
-                    }
-                },
-                {"quartz_cron_expression": "0 0 0 ? * 1", "timezone_id": "UTC"},
-            ),
-            (
-                {
-                    "properties": {
-                        "recurrence": {"frequency": "Week", "interval": 5},
-                        "time_zone": "Eastern Standard Time",
-                    }
+SCHEDULE_TRIGGER_CASES = (
+    pytest.param(
+        {
+            "properties": {
+                "recurrence": {
+                    "frequency": "Day",
+                    "interval": 1,
+                    "schedule": {"hours": [9], "minutes": [0]},
                 },
-                {"quartz_cron_expression": "0 0 0 ? * 1", "timezone_id": "UTC"},
-            ),
-            (
-                {
-                    "properties": {
-                        "recurrence": {
-                            "frequency": "Week",
-                            "interval": 1,
-                            "schedule": {
-                                "week_days": ["Sunday", "Wednesday"],
-                                "hours": [9],
-                                "minutes": [15],
-                            },
-                        },
-                        "time_zone": "Eastern Standard Time",
-                    }
+                "time_zone": "Eastern Standard Time",
+            }
+        },
+        {"quartz_cron_expression": "0 0 9 */1 * ?", "timezone_id": "UTC"},
+        id="daily",
+    ),
+    pytest.param(
+        {
+            "properties": {
+                "recurrence": {
+                    "frequency": "Day",
+                    "interval": 2,
+                    "schedule": {"hours": [9], "minutes": [23]},
                 },
-                {"quartz_cron_expression": "0 15 9 ? * 1,4", "timezone_id": "UTC"},
-            ),
-            (
-                {
-                    "properties": {
-                        "recurrence": {"frequency": "Month", "interval": 1},
-                        "time_zone": "Eastern Standard Time",
-                    }
+                "time_zone": "Eastern Standard Time",
+            }
+        },
+        {"quartz_cron_expression": "0 23 9 */2 * ?", "timezone_id": "UTC"},
+        id="every-two-days",
+    ),
+    pytest.param(
+        {
+            "properties": {
+                "recurrence": {"frequency": "Hour", "interval": 1},
+                "time_zone": "Eastern Standard Time",
+            }
+        },
+        {"quartz_cron_expression": "0 0 */1 * * ?", "timezone_id": "UTC"},
+        id="hourly",
+    ),
+    pytest.param(
+        {
+            "properties": {
+                "recurrence": {"frequency": "Hour", "interval": 5},
+                "time_zone": "Eastern Standard Time",
+            }
+        },
+        {"quartz_cron_expression": "0 0 */5 * * ?", "timezone_id": "UTC"},
+        id="every-five-hours",
+    ),
+    pytest.param(
+        {
+            "properties": {
+                "recurrence": {"frequency": "Week", "interval": 1},
+                "time_zone": "Eastern Standard Time",
+            }
+        },
+        {"quartz_cron_expression": "0 0 0 ? * 1", "timezone_id": "UTC"},
+        id="weekly",
+    ),
+    pytest.param(
+        {
+            "properties": {
+                "recurrence": {"frequency": "Week", "interval": 5},
+                "time_zone": "Eastern Standard Time",
+            }
+        },
+        {"quartz_cron_expression": "0 0 0 ? * 1", "timezone_id": "UTC"},
+        id="weekly-interval-ignored",
+    ),
+    pytest.param(
+        {
+            "properties": {
+                "recurrence": {
+                    "frequency": "Week",
+                    "interval": 1,
+                    "schedule": {
+                        "week_days": ["Sunday", "Wednesday"],
+                        "hours": [9],
+                        "minutes": [15],
+                    },
                 },
-                {"quartz_cron_expression": "0 0 0 0 * ?", "timezone_id": "UTC"},
-            ),
-            (
-                {
-                    "properties": {
-                        "recurrence": {
-                            "frequency": "Month",
-                            "interval": 1,
-                            "schedule": {
-                                "days": [3, 12],
-                                "hours": [9],
-                                "minutes": [15],
-                            },
-                        },
-                        "time_zone": "Eastern Standard Time",
-                    }
+                "time_zone": "Eastern Standard Time",
+            }
+        },
+        {"quartz_cron_expression": "0 15 9 ? * 1,4", "timezone_id": "UTC"},
+        id="weekly-on-days",
+    ),
+    pytest.param(
+        {
+            "properties": {
+                "recurrence": {"frequency": "Month", "interval": 1},
+                "time_zone": "Eastern Standard Time",
+            }
+        },
+        {"quartz_cron_expression": "0 0 0 0 * ?", "timezone_id": "UTC"},
+        id="monthly",
+    ),
+    pytest.param(
+        {
+            "properties": {
+                "recurrence": {
+                    "frequency": "Month",
+                    "interval": 1,
+                    "schedule": {
+                        "days": [3, 12],
+                        "hours": [9],
+                        "minutes": [15],
+                    },
                 },
-                {"quartz_cron_expression": "0 15 9 3,12 * ?", "timezone_id": "UTC"},
-            ),
-            (
-                {
-                    "properties": {
-                        "recurrence": {
-                            "frequency": "Month",
-                            "interval": 5,
-                            "schedule": {
-                                "days": [3, 12],
-                                "hours": [9],
-                                "minutes": [15],
-                            },
-                        },
-                        "time_zone": "Eastern Standard Time",
-                    }
+                "time_zone": "Eastern Standard Time",
+            }
+        },
+        {"quartz_cron_expression": "0 15 9 3,12 * ?", "timezone_id": "UTC"},
+        id="monthly-on-days",
+    ),
+    pytest.param(
+        {
+            "properties": {
+                "recurrence": {
+                    "frequency": "Month",
+                    "interval": 5,
+                    "schedule": {
+                        "days": [3, 12],
+                        "hours": [9],
+                        "minutes": [15],
+                    },
                 },
-                {"quartz_cron_expression": "0 15 9 3,12 * ?", "timezone_id": "UTC"},
-            ),
-        ],
-    )
+                "time_zone": "Eastern Standard Time",
+            }
+        },
+        {"quartz_cron_expression": "0 15 9 3,12 * ?", "timezone_id": "UTC"},
+        id="monthly-interval-ignored",
+    ),
+)
+
+
+INVALID_SCHEDULE_TRIGGER_CASES = (
+    pytest.param({}, 'No value for "properties" with trigger', id="missing-properties"),
+    pytest.param({"properties": {}}, 'No value for "recurrence" with schedule trigger', id="missing-recurrence"),
+)
+
+
+EXTRA_PROPERTY_CASES = (
+    pytest.param("extra_property", "should be ignored", id="string"),
+    pytest.param("another_extra", 123, id="int"),
+    pytest.param("yet_another", {"nested": "value"}, id="dict"),
+)
+
+
+CRON_EXPRESSION_CASES = (
+    pytest.param(None, None, id="none"),
+    pytest.param({"frequency": IntervalType.HOUR, "interval": 2}, "0 0 */2 * * ?", id="hourly"),
+    pytest.param(
+        {
+            "frequency": IntervalType.DAY,
+            "interval": 1,
+            "schedule": {"minutes": [30], "hours": [9]},
+        },
+        "0 30 9 */1 * ?",
+        id="daily",
+    ),
+    pytest.param(
+        {
+            "frequency": IntervalType.WEEK,
+            "schedule": {
+                "minutes": [0],
+                "hours": [8],
+                "week_days": ["Monday", "Wednesday"],
+            },
+        },
+        "0 0 8 ? * 2,4",
+        id="weekly",
+    ),
+    pytest.param(
+        {
+            "frequency": IntervalType.MONTH,
+            "schedule": {"minutes": [15], "hours": [10], "days": [1, 15]},
+        },
+        "0 15 10 1,15 * ?",
+        id="monthly",
+    ),
+)
+
+
+HOURLY_CRON_CASES = (
+    pytest.param(1, "0 0 */1 * * ?", id="every-hour"),
+    pytest.param(3, "0 0 */3 * * ?", id="every-three-hours"),
+)
+
+
+DAILY_CRON_CASES = (
+    pytest.param(1, None, "0 0 0 */1 * ?", id="default"),
+    pytest.param(2, {"minutes": [30], "hours": [9, 18]}, "0 30 9,18 */2 * ?", id="scheduled"),
+)
+
+
+WEEKLY_CRON_CASES = (
+    pytest.param(None, "0 0 0 ? * 1", id="default"),
+    pytest.param({"minutes": [0], "hours": [8], "week_days": ["Monday", "Friday"]}, "0 0 8 ? * 2,6", id="scheduled"),
+)
+
+
+MONTHLY_CRON_CASES = (
+    pytest.param(None, "0 0 0 0 * ?", id="default"),
+    pytest.param({"minutes": [15], "hours": [10], "days": [1, 15]}, "0 15 10 1,15 * ?", id="scheduled"),
+)
+
+
+WEEK_DAY_CASES = (
+    pytest.param("Sunday", "1", id="sunday"),
+    pytest.param("Monday", "2", id="monday"),
+    pytest.param("Tuesday", "3", id="tuesday"),
+    pytest.param("Wednesday", "4", id="wednesday"),
+    pytest.param("Thursday", "5", id="thursday"),
+    pytest.param("Friday", "6", id="friday"),
+    pytest.param("Saturday", "7", id="saturday"),
+)
+
+
+CRON_WARNING_CASES = (
+    pytest.param(
+        {
+            "frequency": IntervalType.WEEK,
+            "interval": 2,
+            "schedule": {"week_days": ["Monday"]},
+        },
+        id="weekly-interval",
+    ),
+    pytest.param({"frequency": IntervalType.MONTH, "interval": 3, "schedule": {"days": [1]}}, id="monthly-interval"),
+)
+
+
+NUMERIC_TYPE_CASES = (
+    pytest.param(
+        {"frequency": IntervalType.MONTH, "interval": 1, "schedule": {"days": [1.0]}},
+        {"frequency": IntervalType.MONTH, "interval": 1, "schedule": {"days": [1]}},
+        "0 0 0 1.0 * ?",
+        "0 0 0 1 * ?",
+        id="schedule-values",
+    ),
+    pytest.param(
+        {"frequency": IntervalType.HOUR, "interval": 2.0},
+        {"frequency": IntervalType.HOUR, "interval": 2},
+        "0 0 */2.0 * * ?",
+        "0 0 */2 * * ?",
+        id="num-intervals",
+    ),
+)
+
+
+class TestTriggerTranslator:
+    """Unit tests for trigger translator methods."""
+
+    @pytest.mark.parametrize("trigger_definition, expected_result", SCHEDULE_TRIGGER_CASES)
     def test_translate_schedule_trigger_parses_result(self, trigger_definition, expected_result):
-        result = translate_schedule_trigger(trigger_definition)
-        assert result == expected_result
+        assert translate_schedule_trigger(trigger_definition) == expected_result
 
     @pytest.mark.parametrize(
-        "trigger_definition, expected_error_message",
-        [
-            ({}, 'No value for "properties" with trigger'),
-            ({"properties": {}}, 'No value for "recurrence" with schedule trigger'),
-        ],
+        "trigger_definition, expected_error_message", INVALID_SCHEDULE_TRIGGER_CASES
     )
     def test_translate_schedule_trigger_excepts(self, trigger_definition, expected_error_message):
         with pytest.raises(ValueError, match=expected_error_message):
             translate_schedule_trigger(trigger_definition)
 
-    @pytest.mark.parametrize(
-        "extra_property, extra_value",
-        [
-            ("extra_property", "should be ignored"),
-            ("another_extra", 123),
-            ("yet_another", {"nested": "value"}),
-        ],
-    )
+    @pytest.mark.parametrize("extra_property, extra_value", EXTRA_PROPERTY_CASES)
     def test_translate_schedule_trigger_ignores(self, extra_property, extra_value):
         input_trigger = {
             "properties": {
@@ -182,97 +294,27 @@ class TestTriggerTranslator:
         result = translate_schedule_trigger(input_trigger)
         assert extra_property not in result
 
-    @pytest.mark.parametrize(
-        "recurrence, expected_result",
-        [
-            (None, None),
-            ({"frequency": IntervalType.HOUR, "interval": 2}, "0 0 */2 * * ?"),
-            (
-                {
-                    "frequency": IntervalType.DAY,
-                    "interval": 1,
-                    "schedule": {"minutes": [30], "hours": [9]},
-                },
-                "0 30 9 */1 * ?",
-            ),
-            (
-                {
-                    "frequency": IntervalType.WEEK,
-                    "schedule": {
-                        "minutes": [0],
-                        "hours": [8],
-                        "week_days": ["Monday", "Wednesday"],
-                    },
-                },
-                "0 0 8 ? * 2,4",
-            ),
-            (
-                {
-                    "frequency": IntervalType.MONTH,
-                    "schedule": {"minutes": [15], "hours": [10], "days": [1, 15]},
-                },
-                "0 15 10 1,15 * ?",
-            ),
-        ],
-    )
+    @pytest.mark.parametrize("recurrence, expected_result", CRON_EXPRESSION_CASES)
     def test_parse_cron_expression(self, recurrence, expected_result):
         assert parse_cron_expression(recurrence) == expected_result
 
-    @pytest.mark.parametrize(
-        "num_intervals, expected_result",
-        [
-            (1, "0 0 */1 * * ?"),
-            (3, "0 0 */3 * * ?"),
-        ],
-    )
+    @pytest.mark.parametrize("num_intervals, expected_result", HOURLY_CRON_CASES)
     def test_get_hourly_cron_expression(self, num_intervals, expected_result):
-        assert _get_hourly_cron_expression(num_intervals) == expected_result
+        assert _get_hourly_cron_expression(num_intervals, None) == expected_result
 
-    @pytest.mark.parametrize(
-        "num_intervals, schedule, expected_result",
-        [
-            (1, None, "0 0 0 */1 * ?"),
-            (2, {"minutes": [30], "hours": [9, 18]}, "0 30 9,18 */2 * ?"),
-        ],
-    )
+    @pytest.mark.parametrize("num_intervals, schedule, expected_result", DAILY_CRON_CASES)
     def test_get_daily_cron_expression(self, num_intervals, schedule, expected_result):
         assert _get_daily_cron_expression(num_intervals, schedule) == expected_result
 
-    @pytest.mark.parametrize(
-        "schedule, expected_result",
-        [
-            (None, "0 0 0 ? * 1"),
-            (
-                {"minutes": [0], "hours": [8], "week_days": ["Monday", "Friday"]},
-                "0 0 8 ? * 2,6",
-            ),
-        ],
-    )
+    @pytest.mark.parametrize("schedule, expected_result", WEEKLY_CRON_CASES)
     def test_get_weekly_cron_expression(self, schedule, expected_result):
-        assert _get_weekly_cron_expression(schedule) == expected_result
+        assert _get_weekly_cron_expression(1, schedule) == expected_result
 
-    @pytest.mark.parametrize(
-        "schedule, expected_result",
-        [
-            (None, "0 0 0 0 * ?"),
-            ({"minutes": [15], "hours": [10], "days": [1, 15]}, "0 15 10 1,15 * ?"),
-        ],
-    )
+    @pytest.mark.parametrize("schedule, expected_result", MONTHLY_CRON_CASES)
     def test_get_monthly_cron_expression(self, schedule, expected_result):
-        assert _get_monthly_cron_expression(schedule) == expected_result
+        assert _get_monthly_cron_expression(1, schedule) == expected_result
 
-    @pytest.mark.parametrize(
-        "week_day, expected_result",
-        [
-            ("Sunday", "1"),
-            ("Monday", "2"),
-            ("Tuesday", "3"),
-            ("Wednesday", "4"),
-            ("Thursday", "5"),
-            ("Friday", "6"),
-            ("Saturday", "7"),
-        ],
-    )
+    @pytest.mark.parametrize("week_day, expected_result", WEEK_DAY_CASES)
     def test_get_week_day(self, week_day, expected_result):
         assert _get_week_day(week_day) == expected_result
 
@@ -281,16 +323,16 @@ class TestTriggerTranslator:
             _get_week_day("InvalidDay")
 
     @pytest.mark.parametrize(
-        "recurrence",
-        [
-            {
-                "frequency": IntervalType.WEEK,
-                "interval": 2,
-                "schedule": {"week_days": ["Monday"]},
-            },
-            {"frequency": IntervalType.MONTH, "interval": 3, "schedule": {"days": [1]}},
-        ],
+        "float_recurrence, int_recurrence, expected_float_result, expected_int_result",
+        NUMERIC_TYPE_CASES,
     )
+    def test_parse_cron_expression_distinguishes_numeric_types(
+        self, float_recurrence, int_recurrence, expected_float_result, expected_int_result
+    ):
+        assert parse_cron_expression(float_recurrence) == expected_float_result
+        assert parse_cron_expression(int_recurrence) == expected_int_result
+
+    @pytest.mark.parametrize("recurrence", CRON_WARNING_CASES)
     def test_parse_cron_expression_warnings(self, recurrence):
         with pytest.warns(UserWarning):
             parse_cron_expression(recurrence)